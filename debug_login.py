@@ -2,8 +2,8 @@
 Debug script to see exactly what's happening during login.
 """
 
-from playwright.sync_api import sync_playwright
 from dotenv import load_dotenv
+from utils.browser import launched_browser, slow_mo_from_env, keep_browser_open
 import os
 
 def debug_login():
@@ -24,10 +24,7 @@ def debug_login():
     print(f"Username: {username}")
     print(f"Password: {'*' * len(password)}\n")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False, slow_mo=1000)
-        page = browser.new_page()
-        
+    with launched_browser(headless=False, slow_mo=slow_mo_from_env()) as (_, _, page):
         try:
             # Step 1: Navigate
             print("1. Navigating to eBay login page...")
@@ -73,7 +70,10 @@ def debug_login():
                         
                         # Wait for password field
                         print(f"\n6. Waiting for password field...")
-                        page.wait_for_timeout(3000)
+                        try:
+                            page.locator("input[type='password']").first.wait_for(state="visible", timeout=10000)
+                        except:
+                            pass  # Reported by the locator loop below
                         print(f"   Current URL: {page.url}")
                         
                         # Try to find password field
@@ -97,8 +97,7 @@ def debug_login():
                         print(f"   ✗ Failed: {str(e)[:50]}")
                         continue
                 
-                print(f"\n8. Keeping browser open for 10 seconds...")
-                page.wait_for_timeout(10000)
+                keep_browser_open(page, 10000, "\n8. Keeping browser open for 10 seconds...")
                 
             except Exception as e:
                 print(f"   ✗ ERROR: {str(e)}")
@@ -110,11 +109,10 @@ def debug_login():
                 inputs = page.locator("input").all()
                 print(f"   Found {len(inputs)} input fields on the page")
                 
-                page.wait_for_timeout(10000)
+                keep_browser_open(page, 10000)
         
         finally:
             print("\nClosing browser...")
-            browser.close()
 
 if __name__ == "__main__":
     debug_login()
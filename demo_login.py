@@ -2,8 +2,8 @@
 Demo script to test eBay login with credentials from .env file.
 """
 
-from playwright.sync_api import sync_playwright
 from pages.login_page import LoginPage
+from utils.browser import launched_browser
 from dotenv import load_dotenv
 import os
 import time
@@ -28,22 +28,13 @@ def demo_login():
     print(f"🔑 Password loaded: {'*' * len(password)}")
     print()
     
-    with sync_playwright() as p:
-        # Launch browser in visible mode
-        print("1. Launching Chrome browser...")
-        browser = p.chromium.launch(
-            headless=False,
-            slow_mo=500  # Slow down actions by 500ms to see them
-        )
-        
-        context = browser.new_context(
-            viewport={'width': 1280, 'height': 720}
-        )
-        page = context.new_page()
-        
-        # Maximize the browser window
-        page.set_viewport_size({'width': 1920, 'height': 1080})
-        
+    # Launch browser in visible mode
+    print("1. Launching Chrome browser...")
+    with launched_browser(
+        headless=False,
+        slow_mo=500,  # Slow down actions by 500ms to see them
+        viewport={'width': 1920, 'height': 1080}  # Large viewport from the start
+    ) as (_, _, page):
         try:
             print("2. Initializing LoginPage...")
             login_page = LoginPage(page)
@@ -76,21 +67,16 @@ def demo_login():
                         if login_page.add_to_cart():
                             print("   ✓ First item added to cart!")
                             
-                            # Go back to search results
-                            print("\n7. Going back to search results...")
-                            login_page.go_back()
-                            print("   ✓ Back to search results")
-                            
-                            # Add 4 more items
-                            print("\n8. Adding 4 additional items to cart...")
+                            # Add 4 more items (returns to the search results itself)
+                            print("\n7. Adding 4 additional items to cart...")
                             added = login_page.add_multiple_items_to_cart(4)
                             print(f"   ✓ Added {added}/4 additional items")
                             
                             # Open shopping cart
-                            print("\n9. Opening shopping cart...")
+                            print("\n8. Opening shopping cart...")
                             if login_page.open_shopping_cart():
                                 print("   ✓ Shopping cart opened!")
-                                print("\n10. Keeping browser open for 30 seconds to view cart...")
+                                print("\n9. Keeping browser open for 30 seconds to view cart...")
                                 time.sleep(30)
                             else:
                                 print("   ✗ Failed to open cart")
@@ -121,8 +107,7 @@ def demo_login():
             time.sleep(10)
         
         finally:
-            print("11. Closing browser...")
-            browser.close()
+            print("10. Closing browser...")
             print("\n✓ Demo completed!")
 
 if __name__ == "__main__":
@@ -2,9 +2,8 @@
 Demo script to show browser navigation with visible browser window.
 """
 
-from playwright.sync_api import sync_playwright
 from pages.login_page import LoginPage
-import time
+from utils.browser import launched_browser, slow_mo_from_env, keep_browser_open
 
 def demo_navigation():
     """Demonstrate browser navigation with visible browser."""
@@ -12,16 +11,11 @@ def demo_navigation():
     print("Starting Browser Demo - Visible Mode")
     print("="*60 + "\n")
     
-    with sync_playwright() as p:
-        # Launch browser in visible mode (headless=False)
-        print("1. Launching Chrome browser...")
-        browser = p.chromium.launch(
-            headless=False,
-            slow_mo=1000  # Slow down actions by 1000ms to see them better
-        )
-        
+    # Launch browser in visible mode (headless=False)
+    print("1. Launching Chrome browser...")
+    # Set PW_SLOWMO=1000 to slow down actions and see them better
+    with launched_browser(headless=False, slow_mo=slow_mo_from_env()) as (_, _, page):
         print("2. Opening new page...")
-        page = browser.new_page()
         
         print("3. Initializing LoginPage...")
         login_page = LoginPage(page)
@@ -34,19 +28,16 @@ def demo_navigation():
             login_page.navigate()
             
             print(f"✓ Successfully navigated to: {page.url}")
-            print("\n5. Keeping browser open for 5 seconds so you can see it...")
-            time.sleep(5)
+            keep_browser_open(page, 5000, "\n5. Keeping browser open for 5 seconds so you can see it...")
             
         except Exception as e:
             print(f"⚠ Navigation encountered: {type(e).__name__}")
             print(f"  Current URL: {page.url}")
             print("  (This is expected if eBay shows CAPTCHA)")
-            print("\n5. Keeping browser open for 5 seconds so you can see the page...")
-            time.sleep(5)
+            keep_browser_open(page, 5000, "\n5. Keeping browser open for 5 seconds so you can see the page...")
         
         finally:
             print("6. Closing browser...")
-            browser.close()
             print("\n✓ Demo completed!")
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 Inspect the eBay login page to find the actual button attributes.
 """
 
-from playwright.sync_api import sync_playwright
+from utils.browser import launched_browser
 
 def inspect_page():
     """Inspect what elements are on the eBay login page."""
@@ -10,14 +10,10 @@ def inspect_page():
     print("INSPECTING: eBay Login Page Elements")
     print("="*60 + "\n")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        page = browser.new_page()
-        
+    with launched_browser(headless=False) as (_, _, page):
         try:
             print("1. Navigating to eBay login page...")
             page.goto("https://signin.ebay.com/", wait_until="domcontentloaded", timeout=30000)
-            page.wait_for_timeout(3000)
             
             print("\n2. Finding and filling email field...")
             email_field = page.locator("//label[text()=\"Email or username\"]/..//input")
@@ -25,36 +21,19 @@ def inspect_page():
             email_field.fill("test@example.com")
             print("   ✓ Email field filled")
             
-            page.wait_for_timeout(1000)
-            
             print("\n3. Looking for ALL buttons on the page...")
-            buttons = page.locator("button").all()
+            # Read every button's attributes in a single round-trip
+            buttons = page.locator("button").evaluate_all(
+                "els => els.map(e => ({text: e.innerText, id: e.id, type: e.getAttribute('type'), cls: e.getAttribute('class')}))"
+            )
             print(f"   Found {len(buttons)} button(s)")
             
             for i, button in enumerate(buttons, 1):
                 print(f"\n   Button #{i}:")
-                try:
-                    print(f"      Text: {button.inner_text()}")
-                except:
-                    print(f"      Text: (no text)")
-                
-                try:
-                    btn_id = button.get_attribute("id")
-                    print(f"      ID: {btn_id if btn_id else '(no id)'}")
-                except:
-                    pass
-                
-                try:
-                    btn_type = button.get_attribute("type")
-                    print(f"      Type: {btn_type if btn_type else '(no type)'}")
-                except:
-                    pass
-                
-                try:
-                    btn_class = button.get_attribute("class")
-                    print(f"      Class: {btn_class if btn_class else '(no class)'}")
-                except:
-                    pass
+                print(f"      Text: {button['text'] if button['text'] else '(no text)'}")
+                print(f"      ID: {button['id'] if button['id'] else '(no id)'}")
+                print(f"      Type: {button['type'] if button['type'] else '(no type)'}")
+                print(f"      Class: {button['cls'] if button['cls'] else '(no class)'}")
             
             print("\n\n4. Keeping browser open for 15 seconds for you to inspect...")
             print("   Look at the Continue button and note its attributes!")
@@ -62,7 +41,6 @@ def inspect_page():
         
         finally:
             print("\nClosing browser...")
-            browser.close()
 
 if __name__ == "__main__":
     inspect_page()
@@ -1,6 +1,24 @@
 """Pages package - Contains all Page Object classes."""
 
-from .base_page import BasePage
-from .login_page import LoginPage
+import importlib
+
+# Page Object classes are imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    'BasePage': '.base_page',
+    'LoginPage': '.login_page',
+}
 
 __all__ = ['BasePage', 'LoginPage']
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,13 +5,31 @@ Implements smart locator strategy with automatic fallback mechanism,
 retry logic, comprehensive logging, and screenshot capture on failures.
 """
 
+import itertools
 import logging
-from typing import Sequence, Tuple, Optional, Union
-from datetime import datetime
+import os
+import re
+import time
+from typing import ClassVar, Dict, Sequence, Tuple, Optional, Union
 from pathlib import Path
 from playwright.sync_api import Page, Locator, Error as PlaywrightError
 
 
+# Plain CSS ID selectors such as "#userid" or "input#userid"
+_CSS_ID_RE = re.compile(r"^[a-z]*#[\w-]+$")
+
+# Selectors that name a Playwright engine explicitly, e.g. "text=Skip" or "xpath=//a"
+_ENGINE_PREFIX_RE = re.compile(r"^[\w-]+=")
+
+# Element-lookup failures only capture screenshots when CAPTURE_SCREENSHOTS=1
+CAPTURE_SCREENSHOTS = os.environ.get("CAPTURE_SCREENSHOTS", "0") == "1"
+
+# Screenshot names: run start time and PID (unique across xdist workers) for
+# grouping, plus a per-process sequence number
+_RUN_TAG = f"{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+_SCREENSHOT_SEQ = itertools.count(1)
+
+
 class BasePage:
     """
     Base class for all Page Objects implementing smart locator strategy.
@@ -20,10 +38,40 @@ class BasePage:
     - Multiple locator support with automatic fallback
     - Configurable retry mechanism
     - Comprehensive logging of locator attempts
-    - Screenshot capture on final failure
+    - Screenshot capture on final failure (opt-in via CAPTURE_SCREENSHOTS=1)
     - Common page operations (click, fill, wait, etc.)
     """
     
+    # Page objects only carry per-instance state in slots
+    __slots__ = ("page", "_locators", "_combined_locators")
+    
+    # One logger per Page Object class, created at class definition
+    logger: ClassVar[logging.Logger] = logging.getLogger("BasePage")
+    
+    # Shared by all page objects; created once per process
+    screenshots_dir: ClassVar[Path] = Path("screenshots")
+    _screenshots_dir_ready: ClassVar[bool] = False
+    
+    # Winning locator per (page class, element name, locator list), tried
+    # first on the next lookup with the same locator list
+    _locator_success_cache: ClassVar[Dict[Tuple[type, str, Tuple[str, ...]], str]] = {}
+    
+    # Tuple locator strategies mapped to their Playwright selector form
+    _STRATEGIES = {
+        "xpath": lambda v: v if v.startswith(("//", "(//")) else f"//{v}",
+        "css": lambda v: v,
+        "text": lambda v: f"text={v}",
+        "id": lambda v: f"#{v}",
+    }
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+        # Normalize every *_LOCATORS list declared on the class, once per process
+        for name, value in list(vars(cls).items()):
+            if name.endswith("_LOCATORS") and isinstance(value, (list, tuple)):
+                setattr(cls, name, cls._normalize_locators(value))
+    
     def __init__(self, page: Page):
         """
         Initialize the base page.
@@ -32,10 +80,126 @@ class BasePage:
             page: Playwright Page object
         """
         self.page = page
-        self.logger = logging.getLogger(self.__class__.__name__)
-        self.screenshots_dir = Path("screenshots")
-        self.screenshots_dir.mkdir(exist_ok=True)
+        self._locators: Dict[str, Locator] = {}
+        self._combined_locators: Dict[Tuple[str, ...], Locator] = {}
+        if not BasePage._screenshots_dir_ready:
+            BasePage.screenshots_dir.mkdir(exist_ok=True)
+            BasePage._screenshots_dir_ready = True
+        
+    def _locator(self, selector: str) -> Locator:
+        """
+        Get a memoized Locator for a selector string.
+        
+        Locators are lazy and re-resolve on every action, so one instance
+        per selector can be reused for the lifetime of the page object.
+        
+        Args:
+            selector: Playwright selector string
+            
+        Returns:
+            Playwright Locator object
+        """
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
+    
+    def _combined_locator(self, selectors: Tuple[str, ...]) -> Locator:
+        """
+        Get a memoized or_() union of several selector strings.
+        
+        Args:
+            selectors: Playwright selector strings, in priority order
+            
+        Returns:
+            Playwright Locator matching any of the selectors
+        """
+        combined = self._combined_locators.get(selectors)
+        if combined is None:
+            combined = self._locator(selectors[0])
+            for selector in selectors[1:]:
+                combined = combined.or_(self._locator(selector))
+            self._combined_locators[selectors] = combined
+        return combined
+    
+    @classmethod
+    def _normalize_locator(cls, locator: Union[str, Tuple[str, str]]) -> str:
+        """
+        Convert a single locator to its Playwright selector string.
+        
+        Args:
+            locator: Locator string or tuple (strategy, value)
+            
+        Returns:
+            Playwright selector string
+        """
+        if not isinstance(locator, tuple):
+            return locator
+        strategy, value = locator
+        normalize = cls._STRATEGIES.get(strategy)
+        return normalize(value) if normalize else value
+    
+    @classmethod
+    def _normalize_locators(
+        cls,
+        locators: Sequence[Union[str, Tuple[str, str]]]
+    ) -> Tuple[str, ...]:
+        """
+        Normalize a locator list once, typically at class definition time.
+        
+        Applied automatically to every *_LOCATORS attribute of a Page Object
+        subclass when the class is created, so that find_element receives
+        plain selector strings and never has to dispatch on the tuple
+        strategy per call. Duplicate selectors are dropped and plain CSS ID
+        selectors (cheapest and most specific) are moved to the front; all
+        other locators keep their declared order.
+        
+        Args:
+            locators: List of locator strings or tuples (strategy, value)
+            
+        Returns:
+            Tuple of unique Playwright selector strings
+        """
+        unique = dict.fromkeys(cls._normalize_locator(locator) for locator in locators)
+        return tuple(sorted(unique, key=lambda s: 0 if _CSS_ID_RE.match(s) else 1))
+    
+    @classmethod
+    def _combine_locators(
+        cls,
+        locators: Sequence[Union[str, Tuple[str, str]]]
+    ) -> Tuple[str, ...]:
+        """
+        Combine a locator list into at most two union selectors.
+        
+        CSS selectors are joined into one selector list and XPath expressions
+        into one XPath union, so a presence check needs one browser query per
+        kind instead of one per locator. Selectors using any other engine
+        (e.g. "text=...") or chained with ">>" cannot be joined and are kept
+        as separate entries after the unions.
         
+        Args:
+            locators: List of locator strings or tuples (strategy, value)
+            
+        Returns:
+            Tuple with the CSS selector list and/or the XPath union,
+            followed by any selectors that could not be combined
+        """
+        css, xpath, other = [], [], []
+        for selector in cls._normalize_locators(locators):
+            if selector.startswith("xpath="):
+                selector = selector[len("xpath="):]
+            elif selector.startswith("css="):
+                selector = selector[len("css="):]
+            
+            if ">>" in selector or _ENGINE_PREFIX_RE.match(selector):
+                other.append(selector)
+            elif selector.startswith(("/", "(/")):
+                xpath.append(selector)
+            else:
+                css.append(selector)
+        unions = (", ".join(css), " | ".join(xpath))
+        return tuple(union for union in unions if union) + tuple(other)
+    
     def find_element(
         self,
         locators: Sequence[Union[str, Tuple[str, str]]],
@@ -49,65 +213,87 @@ class BasePage:
             locators: List of locator strings or tuples (strategy, value)
                      e.g., ["#id", "//xpath", ("css", ".class"), ("xpath", "//div")]
             element_name: Name of the element for logging purposes
-            timeout: Timeout in milliseconds for each locator attempt
+            timeout: Timeout in milliseconds shared by all locator strategies
             
         Returns:
-            Playwright Locator object if found
+            Playwright Locator for the first match of the winning strategy,
+            so actions on it never hit a strict-mode violation
             
         Raises:
             Exception: If all locator strategies fail
         """
-        self.logger.info(f"Searching for '{element_name}' with {len(locators)} locator(s)")
+        # Pre-normalized string locators skip the strategy dispatch
+        normalized = tuple(
+            locator if isinstance(locator, str) else self._normalize_locator(locator)
+            for locator in locators
+        )
+        n = len(normalized)
         
-        for attempt, locator in enumerate(locators, 1):
+        # Fast path: the locator that matched last time for this element is
+        # usually right again, so check it without waiting before racing all
+        cache_key = (type(self), element_name, normalized)
+        cached = self._locator_success_cache.get(cache_key)
+        if cached is not None:
+            element = self._locator(cached)
             try:
-                self.logger.debug(f"Attempt {attempt}/{len(locators)}: Trying locator '{locator}'")
-                
-                # Normalize locator to string format
-                if isinstance(locator, tuple):
-                    strategy, value = locator
-                    if strategy == "xpath":
-                        locator_str = value if value.startswith("//") or value.startswith("(//") else f"//{value}"
-                    elif strategy == "css":
-                        locator_str = value
-                    elif strategy == "text":
-                        locator_str = f"text={value}"
-                    elif strategy == "id":
-                        locator_str = f"#{value}"
-                    else:
-                        locator_str = value
-                else:
-                    locator_str = locator
-                
-                # Try to find the element
-                element = self.page.locator(locator_str)
-                element.wait_for(state="visible", timeout=timeout)
-                
-                self.logger.info(f"✓ SUCCESS: Found '{element_name}' using locator {attempt}: '{locator}'")
-                return element
-                
+                if element.first.is_visible():
+                    self.logger.info("✓ SUCCESS: Found '%s' using cached locator: '%s'", element_name, cached)
+                    return element.first
+            except PlaywrightError:
+                pass
+        
+        # Race all strategies in a single browser-side wait instead of
+        # paying the full timeout for every locator that does not match
+        combined = self._combined_locator(normalized) if normalized else None
+        
+        found = False
+        if combined is not None:
+            try:
+                combined.locator("visible=true").first.wait_for(state="visible", timeout=timeout)
+                found = True
             except (PlaywrightError, TimeoutError):
-                self.logger.warning(f"✗ FAILED: Locator {attempt}/{len(locators)} timed out for '{element_name}': '{locator}'")
-                continue
+                pass
+        
+        # Post-hoc check (no waiting) to report which strategy matched;
+        # attempts are collected and logged as a single record
+        attempts = []
+        for attempt, locator_str in enumerate(normalized, 1):
+            element = self._locator(locator_str)
+            try:
+                if found and element.first.is_visible():
+                    self.logger.info(
+                        "✓ SUCCESS: Found '%s' using locator %d/%d: '%s'",
+                        element_name, attempt, n, locators[attempt - 1]
+                    )
+                    self._locator_success_cache[cache_key] = locator_str
+                    return element.first
+                attempts.append((attempt, locator_str, "not visible"))
             except Exception as e:
-                self.logger.warning(f"✗ FAILED: Locator {attempt}/{len(locators)} error for '{element_name}': {str(e)}")
-                continue
+                attempts.append((attempt, locator_str, f"error: {e}"))
         
-        # All locators failed - take screenshot and raise exception
-        self.logger.error(f"✗ FINAL FAILURE: All {len(locators)} locators failed for '{element_name}'")
-        screenshot_path = self._take_screenshot(f"failed_{element_name}")
-        self.logger.error(f"Screenshot saved to: {screenshot_path}")
+        if found:
+            # Matched element changed between the wait and the post-hoc check
+            self.logger.info("✓ SUCCESS: Found '%s' using combined locator", element_name)
+            return combined.locator("visible=true").first
         
-        raise Exception(
-            f"Failed to find '{element_name}' after trying {len(locators)} locator strategies. "
-            f"Screenshot: {screenshot_path}"
-        )
+        self.logger.warning("✗ FAILED: find_element('%s') attempts: %r", element_name, attempts)
+        
+        # All locators failed - take screenshot (if enabled) and raise exception
+        self.logger.error("✗ FINAL FAILURE: All %d locators failed for '%s'", n, element_name)
+        message = f"Failed to find '{element_name}' after trying {n} locator strategies."
+        if CAPTURE_SCREENSHOTS:
+            screenshot_path = self._take_screenshot(f"failed_{element_name}")
+            self.logger.error("Screenshot saved to: %s", screenshot_path)
+            message += f" Screenshot: {screenshot_path}"
+        
+        raise Exception(message)
     
     def click_element(
         self,
         locators: Sequence[Union[str, Tuple[str, str]]],
         element_name: str = "Element",
-        timeout: int = 10000
+        timeout: int = 10000,
+        no_wait_after: bool = False
     ) -> None:
         """
         Click an element using smart locator strategy.
@@ -116,10 +302,12 @@ class BasePage:
             locators: List of locator strategies
             element_name: Name of the element for logging
             timeout: Timeout in milliseconds
+            no_wait_after: Return right after the click instead of waiting for
+                           any navigation it starts (caller handles the wait)
         """
         element = self.find_element(locators, element_name, timeout)
-        self.logger.info(f"Clicking on '{element_name}'")
-        element.click()
+        self.logger.info("Clicking on '%s'", element_name)
+        element.click(no_wait_after=no_wait_after)
         
     def fill_element(
         self,
@@ -137,14 +325,15 @@ class BasePage:
             text: Text to fill
             element_name: Name of the element for logging
             timeout: Timeout in milliseconds
-            clear_first: Whether to clear the field before filling
+            clear_first: Whether to replace the existing value (False appends by typing)
         """
         element = self.find_element(locators, element_name, timeout)
-        self.logger.info(f"Filling '{element_name}' with: '{text}'")
+        self.logger.info("Filling '%s' with: '%s'", element_name, text)
         
         if clear_first:
-            element.fill("")  # Clear by filling with empty string
-        element.fill(text)
+            element.fill(text)  # fill() already replaces the current value
+        else:
+            element.press_sequentially(text)
         
     def get_text(
         self,
@@ -165,7 +354,7 @@ class BasePage:
         """
         element = self.find_element(locators, element_name, timeout)
         text = element.inner_text()
-        self.logger.debug(f"Retrieved text from '{element_name}': '{text}'")
+        self.logger.debug("Retrieved text from '%s': '%s'", element_name, text)
         return text
     
     def get_attribute(
@@ -189,33 +378,48 @@ class BasePage:
         """
         element = self.find_element(locators, element_name, timeout)
         value = element.get_attribute(attribute)
-        self.logger.debug(f"Retrieved attribute '{attribute}' from '{element_name}': '{value}'")
+        self.logger.debug("Retrieved attribute '%s' from '%s': '%s'", attribute, element_name, value)
         return value
     
     def is_element_visible(
         self,
         locators: Sequence[Union[str, Tuple[str, str]]],
         element_name: str = "Element",
-        timeout: int = 5000
+        timeout: int = 5000,
+        wait: bool = False
     ) -> bool:
         """
         Check if an element is visible using smart locator strategy.
         
+        By default this is an immediate check that does not wait for the
+        element to appear, so absent elements are reported without delay.
+        
         Args:
             locators: List of locator strategies
             element_name: Name of the element for logging
-            timeout: Timeout in milliseconds
+            timeout: Timeout in milliseconds (only used when wait=True)
+            wait: Whether to wait up to timeout for the element to appear
             
         Returns:
             True if element is visible, False otherwise
         """
+        if not wait:
+            # One query for all strategies instead of one is_visible() per locator
+            selectors = tuple(self._normalize_locator(locator) for locator in locators)
+            try:
+                visible = bool(selectors) and self._combined_locator(selectors).locator("visible=true").count() > 0
+            except PlaywrightError:
+                visible = False
+            self.logger.debug("Element '%s' visibility: %s", element_name, visible)
+            return visible
+        
         try:
             element = self.find_element(locators, element_name, timeout)
             visible = element.is_visible()
-            self.logger.debug(f"Element '{element_name}' visibility: {visible}")
+            self.logger.debug("Element '%s' visibility: %s", element_name, visible)
             return visible
         except Exception:
-            self.logger.debug(f"Element '{element_name}' not found or not visible")
+            self.logger.debug("Element '%s' not found or not visible", element_name)
             return False
     
     def wait_for_element(
@@ -237,18 +441,21 @@ class BasePage:
         Returns:
             Playwright Locator object
         """
-        self.logger.info(f"Waiting for '{element_name}' to be '{state}'")
+        self.logger.info("Waiting for '%s' to be '%s'", element_name, state)
         return self.find_element(locators, element_name, timeout)
     
-    def wait_for_page_load(self, timeout: int = 30000) -> None:
+    def wait_for_page_load(self, timeout: int = 30000, state: str = "domcontentloaded") -> None:
         """
         Wait for the page to finish loading.
         
         Args:
             timeout: Timeout in milliseconds
+            state: Load state to wait for (load, domcontentloaded, networkidle).
+                   eBay rarely reaches networkidle because of tracking beacons,
+                   so only pass it when idle network is really required.
         """
-        self.logger.info("Waiting for page to load")
-        self.page.wait_for_load_state("networkidle", timeout=timeout)
+        self.logger.info("Waiting for page to reach '%s'", state)
+        self.page.wait_for_load_state(state, timeout=timeout)
         
     def navigate_to(self, url: str) -> None:
         """
@@ -257,9 +464,8 @@ class BasePage:
         Args:
             url: URL to navigate to
         """
-        self.logger.info(f"Navigating to: {url}")
+        self.logger.info("Navigating to: %s", url)
         self.page.goto(url, wait_until="domcontentloaded")
-        self.page.wait_for_timeout(1000)
         
     def get_current_url(self) -> str:
         """
@@ -269,36 +475,40 @@ class BasePage:
             Current URL
         """
         url = self.page.url
-        self.logger.debug(f"Current URL: {url}")
+        self.logger.debug("Current URL: %s", url)
         return url
     
-    def _take_screenshot(self, name: str) -> str:
+    def _take_screenshot(self, name: str, full_page: bool = False) -> str:
         """
         Take a screenshot and save it to the screenshots directory.
         
+        Screenshots are saved as JPEG, which is much smaller and faster to
+        encode than PNG and good enough for diagnosing failures.
+        
         Args:
             name: Name for the screenshot file
+            full_page: Whether to capture the full scrollable page instead of the viewport
             
         Returns:
             Path to the saved screenshot
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{name}_{timestamp}.png"
-        filepath = self.screenshots_dir / filename
+        filename = f"{name}_{_RUN_TAG}_{next(_SCREENSHOT_SEQ)}.jpg"
+        filepath = f"{self.screenshots_dir}/{filename}"
         
-        self.page.screenshot(path=str(filepath), full_page=True)
-        return str(filepath)
+        self.page.screenshot(path=filepath, full_page=full_page, type="jpeg", quality=70)
+        return filepath
     
-    def take_screenshot(self, name: str = "screenshot") -> str:
+    def take_screenshot(self, name: str = "screenshot", full_page: bool = False) -> str:
         """
         Public method to take a screenshot.
         
         Args:
             name: Name for the screenshot file
+            full_page: Whether to capture the full scrollable page instead of the viewport
             
         Returns:
             Path to the saved screenshot
         """
-        screenshot_path = self._take_screenshot(name)
-        self.logger.info(f"Screenshot saved: {screenshot_path}")
+        screenshot_path = self._take_screenshot(name, full_page)
+        self.logger.info("Screenshot saved: %s", screenshot_path)
         return screenshot_path
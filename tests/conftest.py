@@ -0,0 +1,22 @@
+"""
+Shared pytest fixtures for the browser tests.
+"""
+
+import pytest
+
+@pytest.fixture(scope="module")
+def shared_browser():
+    """Launch one Chromium instance shared by every test in a module."""
+    from playwright.sync_api import sync_playwright
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        yield browser
+        browser.close()
+
+@pytest.fixture
+def blank_page(shared_browser):
+    """Give each test a fresh page in the shared browser."""
+    page = shared_browser.new_page()
+    yield page
+    page.close()
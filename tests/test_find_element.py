@@ -0,0 +1,78 @@
+"""
+Browser tests for BasePage's element lookup against static HTML.
+
+Each test renders its own markup with page.set_content, so no network is needed.
+"""
+
+import time
+from pages.base_page import BasePage
+
+
+def test_find_element_returns_declared_priority_winner(blank_page):
+    """Test that the first locator in declared order wins, not the first element in the DOM."""
+    blank_page.set_content("""
+        <button class="secondary">Secondary</button>
+        <button class="primary">Primary</button>
+    """)
+    base_page = BasePage(blank_page)
+    
+    element = base_page.find_element([".primary", ".secondary"], "Priority button", timeout=2000)
+    assert element.inner_text() == "Primary"
+    print("✓ Declared-priority locator returned")
+
+def test_find_element_returns_first_of_multiple_matches(blank_page):
+    """Test that a selector matching several elements resolves to the first one."""
+    blank_page.set_content("""
+        <ul>
+            <li class="item">One</li>
+            <li class="item">Two</li>
+            <li class="item">Three</li>
+        </ul>
+    """)
+    base_page = BasePage(blank_page)
+    
+    element = base_page.find_element(["li.item"], "List item", timeout=2000)
+    # Would raise a strict-mode violation if the locator was not narrowed
+    element.click()
+    assert element.inner_text() == "One"
+    print("✓ First of multiple matches returned")
+
+def test_find_element_skips_hidden_first_match(blank_page):
+    """Test that a hidden first match does not hide a visible later match."""
+    blank_page.set_content("""
+        <button class="go" style="display: none">Hidden</button>
+        <button class="go">Shown</button>
+    """)
+    base_page = BasePage(blank_page)
+    
+    element = base_page.find_element(["button.go"], "Go button", timeout=2000)
+    assert element.is_visible()
+    assert element.inner_text() == "Shown"
+    print("✓ Visible later match returned")
+
+def test_find_element_cache_is_keyed_per_locator_list(blank_page):
+    """Test that a cached winner for one locator list is not reused for another."""
+    blank_page.set_content("""
+        <button class="first">First</button>
+        <button class="second">Second</button>
+    """)
+    base_page = BasePage(blank_page)
+    
+    first = base_page.find_element([".first"], "Shared name", timeout=2000)
+    second = base_page.find_element([".second"], "Shared name", timeout=2000)
+    assert first.inner_text() == "First"
+    assert second.inner_text() == "Second"
+    print("✓ Locator cache keyed per locator list")
+
+def test_is_element_visible_returns_false_immediately(blank_page):
+    """Test that an absent element is reported as not visible without waiting."""
+    blank_page.set_content("<p>Nothing to see here</p>")
+    base_page = BasePage(blank_page)
+    
+    start = time.monotonic()
+    visible = base_page.is_element_visible(["#missing", "//button"], "Missing element", timeout=5000)
+    elapsed = time.monotonic() - start
+    
+    assert visible is False
+    assert elapsed < 1
+    print("✓ Absent element reported without waiting")
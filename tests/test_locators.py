@@ -0,0 +1,76 @@
+"""
+Unit tests for the locator normalization helpers in BasePage.
+
+These run without launching a browser.
+"""
+
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+
+
+def test_normalize_locators_drops_duplicates():
+    """Test that duplicate selectors are dropped, keeping the first occurrence."""
+    normalized = BasePage._normalize_locators([".a", "//b", ".a", ("css", ".a"), "//b"])
+    assert normalized == (".a", "//b")
+    print("✓ Duplicate locators dropped")
+
+def test_normalize_locators_moves_css_ids_first():
+    """Test that CSS ID selectors move to the front and everything else keeps its order."""
+    normalized = BasePage._normalize_locators([
+        "//input[@name='q']",
+        ".search",
+        "#gh-ac",
+        "input[name='_nkw']",
+        "input#userid",
+    ])
+    assert normalized == (
+        "#gh-ac",
+        "input#userid",
+        "//input[@name='q']",
+        ".search",
+        "input[name='_nkw']",
+    )
+    print("✓ CSS ID locators ordered first")
+
+def test_normalize_locators_converts_tuples():
+    """Test that (strategy, value) tuples become Playwright selector strings."""
+    normalized = BasePage._normalize_locators([
+        ("id", "userid"),
+        ("xpath", "//button"),
+        ("text", "Continue"),
+        ("css", ".btn"),
+    ])
+    assert normalized == ("#userid", "//button", "text=Continue", ".btn")
+    print("✓ Tuple locators normalized")
+
+def test_locator_attributes_normalized_at_class_creation():
+    """Test that *_LOCATORS attributes of a page class are normalized automatically."""
+    class ExamplePage(BasePage):
+        BUTTON_LOCATORS = ["//button", ("id", "go"), "//button"]
+        TITLE_LOCATOR = "h1"
+        OTHER_VALUES = ["b", "a", "b"]
+
+    assert ExamplePage.BUTTON_LOCATORS == ("#go", "//button")
+    assert ExamplePage.TITLE_LOCATOR == "h1"
+    assert ExamplePage.OTHER_VALUES == ["b", "a", "b"]
+    assert isinstance(LoginPage.USERNAME_LOCATORS, tuple)
+    print("✓ Page class locators normalized at class creation")
+
+def test_combine_locators_splits_css_and_xpath():
+    """Test that CSS and XPath locators are joined into one union each."""
+    combined = BasePage._combine_locators(["#a", "//b", ".c", "(//d)[1]"])
+    assert combined == ("#a, .c", "//b | (//d)[1]")
+    print("✓ CSS and XPath locators combined")
+
+def test_combine_locators_keeps_engine_selectors_separate():
+    """Test that engine-prefixed and chained selectors are not joined into a union."""
+    combined = BasePage._combine_locators([
+        ".a",
+        ("text", "Skip"),
+        "xpath=//b",
+        "css=.c",
+        "#d >> .e",
+    ])
+    assert combined == (".a, .c", "//b", "text=Skip", "#d >> .e")
+    assert BasePage._combine_locators([".only"]) == (".only",)
+    print("✓ Engine-prefixed locators kept separate")
@@ -0,0 +1 @@
+"""Utils package - Shared helpers for scripts and tests."""
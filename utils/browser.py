@@ -0,0 +1,87 @@
+"""
+Browser Module - Shared Playwright bootstrap for the demo and debug scripts.
+
+Launches Chromium and yields a ready page, optionally through a persistent
+profile so repeated runs reuse the browser cache and session cookies.
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
+
+
+# Profile directory used when PLAYWRIGHT_USE_PERSISTENT=1
+PERSISTENT_PROFILE_DIR = ".pw-cache"
+
+
+def slow_mo_from_env(default: int = 0) -> int:
+    """
+    Read the Playwright slow-motion delay from the PW_SLOWMO env variable.
+    
+    Args:
+        default: Delay in milliseconds when PW_SLOWMO is not set
+        
+    Returns:
+        Delay in milliseconds
+    """
+    return int(os.getenv("PW_SLOWMO", str(default)))
+
+
+def keep_browser_open(page: Page, timeout: int, message: Optional[str] = None) -> None:
+    """
+    Keep the browser open for inspection, only when PW_KEEP_OPEN=1.
+    
+    Args:
+        page: Playwright Page object
+        timeout: Time to keep the browser open in milliseconds
+        message: Optional progress line, printed only when the browser is kept open
+    """
+    if os.getenv("PW_KEEP_OPEN") == "1":
+        if message:
+            print(message)
+        page.wait_for_timeout(timeout)
+
+
+@contextmanager
+def launched_browser(
+    slow_mo: int = 0,
+    headless: bool = True,
+    viewport: Optional[Dict[str, int]] = None
+) -> Iterator[Tuple[Optional[Browser], BrowserContext, Page]]:
+    """
+    Launch Chromium and yield a browser, context and page.
+    
+    Set PLAYWRIGHT_USE_PERSISTENT=1 to launch through a persistent profile
+    in PERSISTENT_PROFILE_DIR instead of a throwaway context. In that mode
+    no separate Browser object exists and None is yielded in its place.
+    
+    Args:
+        slow_mo: Delay in milliseconds added to every Playwright action
+        headless: Whether to run the browser without a visible window
+        viewport: Viewport size, e.g. {'width': 1920, 'height': 1080}
+        
+    Yields:
+        Tuple of (browser, context, page)
+    """
+    with sync_playwright() as p:
+        browser = None
+        if os.getenv("PLAYWRIGHT_USE_PERSISTENT") == "1":
+            context = p.chromium.launch_persistent_context(
+                user_data_dir=PERSISTENT_PROFILE_DIR,
+                headless=headless,
+                slow_mo=slow_mo,
+                viewport=viewport
+            )
+            page = context.pages[0] if context.pages else context.new_page()
+        else:
+            browser = p.chromium.launch(headless=headless, slow_mo=slow_mo)
+            context = browser.new_context(viewport=viewport)
+            page = context.new_page()
+        
+        try:
+            yield browser, context, page
+        finally:
+            context.close()
+            if browser is not None:
+                browser.close()